@@ -26,89 +26,276 @@ Implementation Notes
 """
 
 import struct
-import busio
+import time
+from collections import namedtuple
 from adafruit_bus_device import i2c_device
 
 try:
-    from typing import Tuple, List, Dict
+    from typing import Tuple, List, Dict, Iterator
+    from busio import I2C
 except ImportError:
     pass
 
+try:
+    # Let the MicroPython compiler inline integer constants as immediates.
+    from micropython import const
+except ImportError:
+
+    def const(value: int) -> int:
+        """No-op stand-in for micropython.const."""
+        return value
+
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_HDC302x.git"
 
 
+def _generate_crc8_table() -> bytes:
+    """Precompute the CRC-8 table for polynomial 0x31."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc << 1) ^ 0x31 if crc & 0x80 else crc << 1
+        table.append(crc & 0xFF)
+    return bytes(table)
+
+
+_CRC8_TABLE = _generate_crc8_table()
+
+
+def _crc8_word(value: int) -> int:
+    """CRC-8 of a 16-bit word via two table lookups, no buffer needed."""
+    crc = _CRC8_TABLE[0xFF ^ (value >> 8)]
+    return _CRC8_TABLE[crc ^ (value & 0xFF)]
+
+
+def _crc8(data: bytes) -> int:
+    """CRC-8 of a byte sequence with the precomputed lookup table."""
+    crc = 0xFF
+    for byte in data:
+        crc = _CRC8_TABLE[crc ^ byte]
+    return crc
+
+
+# Cached Struct for the 6-byte sample frame: two big-endian words, each
+# followed by its CRC byte.
+_TRH_STRUCT = struct.Struct(">HBHB")
+
+# Auto measurement mode command codes. These integers are the canonical
+# values for the auto_mode setter; the string keys in HDC302x.AUTO_MODES
+# remain as a deprecated alias.
+AUTO_MODE_5MPS_LP0 = const(0x2032)
+AUTO_MODE_5MPS_LP1 = const(0x2024)
+AUTO_MODE_5MPS_LP2 = const(0x202F)
+AUTO_MODE_5MPS_LP3 = const(0x20FF)
+AUTO_MODE_1MPS_LP0 = const(0x2130)
+AUTO_MODE_1MPS_LP1 = const(0x2126)
+AUTO_MODE_1MPS_LP2 = const(0x212D)
+AUTO_MODE_1MPS_LP3 = const(0x21FF)
+AUTO_MODE_2MPS_LP0 = const(0x2236)
+AUTO_MODE_2MPS_LP1 = const(0x2220)
+AUTO_MODE_2MPS_LP2 = const(0x222B)
+AUTO_MODE_2MPS_LP3 = const(0x22FF)
+AUTO_MODE_4MPS_LP0 = const(0x2334)
+AUTO_MODE_4MPS_LP1 = const(0x2322)
+AUTO_MODE_4MPS_LP2 = const(0x2329)
+AUTO_MODE_4MPS_LP3 = const(0x23FF)
+AUTO_MODE_10MPS_LP0 = const(0x2737)
+AUTO_MODE_10MPS_LP1 = const(0x2721)
+AUTO_MODE_10MPS_LP2 = const(0x272A)
+AUTO_MODE_10MPS_LP3 = const(0x27FF)
+AUTO_MODE_EXIT = const(0x3093)
+
+_VALID_AUTO_MODES = frozenset(
+    (
+        AUTO_MODE_5MPS_LP0,
+        AUTO_MODE_5MPS_LP1,
+        AUTO_MODE_5MPS_LP2,
+        AUTO_MODE_5MPS_LP3,
+        AUTO_MODE_1MPS_LP0,
+        AUTO_MODE_1MPS_LP1,
+        AUTO_MODE_1MPS_LP2,
+        AUTO_MODE_1MPS_LP3,
+        AUTO_MODE_2MPS_LP0,
+        AUTO_MODE_2MPS_LP1,
+        AUTO_MODE_2MPS_LP2,
+        AUTO_MODE_2MPS_LP3,
+        AUTO_MODE_4MPS_LP0,
+        AUTO_MODE_4MPS_LP1,
+        AUTO_MODE_4MPS_LP2,
+        AUTO_MODE_4MPS_LP3,
+        AUTO_MODE_10MPS_LP0,
+        AUTO_MODE_10MPS_LP1,
+        AUTO_MODE_10MPS_LP2,
+        AUTO_MODE_10MPS_LP3,
+        AUTO_MODE_EXIT,
+    )
+)
+
+# Heater power register values; canonical values for the heater setter.
+HEATER_OFF = const(0x0000)
+HEATER_QUARTER_POWER = const(0x009F)
+HEATER_HALF_POWER = const(0x03FF)
+HEATER_FULL_POWER = const(0x3FFF)
+
+_VALID_HEATER_POWERS = frozenset(
+    (HEATER_OFF, HEATER_QUARTER_POWER, HEATER_HALF_POWER, HEATER_FULL_POWER)
+)
+
+# Offset register LSB sizes (0.1708984375 deg C, 0.1953125 %% RH) expressed
+# in milli-units as Q20 fixed-point reciprocals, so an offset byte can be
+# computed with an integer multiply and shift instead of a float division.
+_T_MILLI_LSB_INV_Q20 = round((1 << 20) / 170.8984375)
+_RH_MILLI_LSB_INV_Q20 = round((1 << 20) / 195.3125)
+
+# All 256 possible offset bytes decoded to floats (bit 7 is the sign,
+# set meaning positive), so inverting an offset is a single table index.
+_T_OFFSET_TABLE = tuple(
+    ((i & 0x7F) if i & 0x80 else -(i & 0x7F)) * 0.1708984375 for i in range(256)
+)
+_RH_OFFSET_TABLE = tuple(
+    ((i & 0x7F) if i & 0x80 else -(i & 0x7F)) * 0.1953125 for i in range(256)
+)
+
+# Raw-count-to-unit scale factors, precomputed so each sample decode is a
+# single multiplication instead of a division by 65535.
+_T_SCALE = 175.0 / 65535.0
+_T_OFFSET = -45.0
+_RH_SCALE = 100.0 / 65535.0
+
+# Inverse scale factors for converting alert thresholds to raw counts
+# with a multiplication instead of a division.
+_ALERT_T_SCALE = 65535.0 / 175.0
+_ALERT_RH_SCALE = 65535.0 / 100.0
+
+# Command codes
+_CMD_STATUS = const(0xF32D)
+_CMD_MANUFACTURER_ID = const(0x3781)
+_CMD_NIST_ID = const(0x3683)
+_CMD_AUTO_READ = const(0xE000)
+_CMD_SINGLE_SHOT = const(0x2400)
+_CMD_HEATER_OFF = const(0x3066)
+_CMD_HEATER_ENABLE = const(0x306D)
+_CMD_HEATER_POWER = const(0x306E)
+_CMD_OFFSETS = const(0xA004)
+_CMD_SET_HIGH_ALERT = const(0x611D)
+_CMD_SET_LOW_ALERT = const(0x6100)
+_CMD_CLEAR_HIGH_ALERT = const(0x6116)
+_CMD_CLEAR_LOW_ALERT = const(0x610B)
+
+# Status register bit masks
+_STATUS_HEATER = const(1 << 13)
+_STATUS_HIGH_ALERT = const((1 << 10) | (1 << 9))
+_STATUS_LOW_ALERT = const((1 << 12) | (1 << 11))
+
+# How long (in nanoseconds) a paired temperature/humidity reading stays
+# fresh, so reading both properties back to back costs a single I2C
+# transaction. Timed with time.monotonic_ns, whose integer ticks do not
+# lose precision with uptime the way float time.monotonic does.
+_TRH_CACHE_TIMEOUT_NS = const(5_000_000)
+
+# How long (in nanoseconds) a status register read is shared between the
+# heater, high_alert and low_alert properties.
+_STATUS_CACHE_TIMEOUT_NS = const(5_000_000)
+
+# Decoded status register flags returned by HDC302x.status_bits
+StatusBits = namedtuple("StatusBits", ("heater", "high_alert", "low_alert"))
+
+
 class HDC302x:
     """Driver for the HDC302x temperature and humidity sensor."""
 
-    # Auto modes
+    # Deprecated string aliases for the module-level AUTO_MODE_* constants
     AUTO_MODES: Dict[str, int] = {
-        "5MPS_LP0": 0x2032,
-        "5MPS_LP1": 0x2024,
-        "5MPS_LP2": 0x202F,
-        "5MPS_LP3": 0x20FF,
-        "1MPS_LP0": 0x2130,
-        "1MPS_LP1": 0x2126,
-        "1MPS_LP2": 0x212D,
-        "1MPS_LP3": 0x21FF,
-        "2MPS_LP0": 0x2236,
-        "2MPS_LP1": 0x2220,
-        "2MPS_LP2": 0x222B,
-        "2MPS_LP3": 0x22FF,
-        "4MPS_LP0": 0x2334,
-        "4MPS_LP1": 0x2322,
-        "4MPS_LP2": 0x2329,
-        "4MPS_LP3": 0x23FF,
-        "10MPS_LP0": 0x2737,
-        "10MPS_LP1": 0x2721,
-        "10MPS_LP2": 0x272A,
-        "10MPS_LP3": 0x27FF,
-        "EXIT_AUTO_MODE": 0x3093,
+        "5MPS_LP0": AUTO_MODE_5MPS_LP0,
+        "5MPS_LP1": AUTO_MODE_5MPS_LP1,
+        "5MPS_LP2": AUTO_MODE_5MPS_LP2,
+        "5MPS_LP3": AUTO_MODE_5MPS_LP3,
+        "1MPS_LP0": AUTO_MODE_1MPS_LP0,
+        "1MPS_LP1": AUTO_MODE_1MPS_LP1,
+        "1MPS_LP2": AUTO_MODE_1MPS_LP2,
+        "1MPS_LP3": AUTO_MODE_1MPS_LP3,
+        "2MPS_LP0": AUTO_MODE_2MPS_LP0,
+        "2MPS_LP1": AUTO_MODE_2MPS_LP1,
+        "2MPS_LP2": AUTO_MODE_2MPS_LP2,
+        "2MPS_LP3": AUTO_MODE_2MPS_LP3,
+        "4MPS_LP0": AUTO_MODE_4MPS_LP0,
+        "4MPS_LP1": AUTO_MODE_4MPS_LP1,
+        "4MPS_LP2": AUTO_MODE_4MPS_LP2,
+        "4MPS_LP3": AUTO_MODE_4MPS_LP3,
+        "10MPS_LP0": AUTO_MODE_10MPS_LP0,
+        "10MPS_LP1": AUTO_MODE_10MPS_LP1,
+        "10MPS_LP2": AUTO_MODE_10MPS_LP2,
+        "10MPS_LP3": AUTO_MODE_10MPS_LP3,
+        "EXIT_AUTO_MODE": AUTO_MODE_EXIT,
     }
-    # Heater power options
+    # Deprecated string aliases for the module-level HEATER_* constants
     HEATER_POWERS: Dict[str, int] = {
-        "OFF": 0x0000,
-        "QUARTER_POWER": 0x009F,
-        "HALF_POWER": 0x03FF,
-        "FULL_POWER": 0x3FFF,
+        "OFF": HEATER_OFF,
+        "QUARTER_POWER": HEATER_QUARTER_POWER,
+        "HALF_POWER": HEATER_HALF_POWER,
+        "FULL_POWER": HEATER_FULL_POWER,
     }
 
-    def __init__(self, i2c_bus: busio.I2C, address: int = 0x44) -> None:
+    def __init__(
+        self, i2c_bus: I2C, address: int = 0x44, verify_crc: bool = True
+    ) -> None:
         """
         Initialize the HDC302x sensor with the given I2C bus and address.
 
         :param i2c_bus: The I2C bus object.
         :param address: The I2C address of the sensor.
+        :param verify_crc: Verify the CRC of data read from the sensor.
+            Disabling skips the checksum work on every read, trading
+            corruption detection for throughput on short, reliable buses.
         """
         self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
-        self._current_auto_mode = self.AUTO_MODES["EXIT_AUTO_MODE"]
+        self._verify_crc = verify_crc
+        self._current_auto_mode = AUTO_MODE_EXIT
+        self._last_trh = None
+        self._last_trh_cmd = None
+        self._last_trh_time = -_TRH_CACHE_TIMEOUT_NS
+        # Immutable device identifiers, read lazily and kept for the life
+        # of the driver so repeat accesses stay off the bus.
+        self._manufacturer_id = None
+        self._nist_id = None
+        self._status_val = 0
+        self._status_time = -_STATUS_CACHE_TIMEOUT_NS
+        # Preallocated I2C buffers, reused across calls to avoid heap
+        # allocations in polling loops. Sharing them makes the driver
+        # non-re-entrant, which is fine for single-threaded CircuitPython.
+        self._cmd2 = bytearray(2)
+        self._cmd5 = bytearray(5)
+        self._rx3 = bytearray(3)
+        self._rx6 = bytearray(6)
 
     @property
     def heater(self) -> bool:
         """
         Heater power. Can be set to:
 
-        "OFF", "QUARTER_POWER",
-        "HALF_POWER", "FULL_POWER"
+        ``HEATER_OFF``, ``HEATER_QUARTER_POWER``,
+        ``HEATER_HALF_POWER``, ``HEATER_FULL_POWER``
 
         :return: True if the heater is on, False otherwise.
         """
-        status = self._read_command(0xF32D)
-        return bool(status & (1 << 13))
+        return bool(self._read_status() & _STATUS_HEATER)
 
     @heater.setter
-    def heater(self, power: str) -> None:
+    def heater(self, power: int) -> None:
         """
         :param power: The heater power level.
         """
-        if power not in self.HEATER_POWERS:
+        if isinstance(power, str):
+            power = self.HEATER_POWERS.get(power)
+        if power not in _VALID_HEATER_POWERS:
             raise ValueError("Invalid heater power value.")
-        _power = self.HEATER_POWERS[power]
-        if _power == self.HEATER_POWERS["OFF"]:
-            self._write_command(0x3066)
+        if power == HEATER_OFF:
+            self._write_command(_CMD_HEATER_OFF)
         else:
-            self._write_command(0x306D)
-            self._write_command_data(0x306E, _power)
+            self._write_command(_CMD_HEATER_ENABLE)
+            self._write_command_data(_CMD_HEATER_POWER, power)
 
     @property
     def status(self) -> int:
@@ -117,7 +304,21 @@ class HDC302x:
 
         :return: The status of the sensor.
         """
-        return self._read_command(0xF32D)
+        return self._read_status(0)
+
+    def status_bits(self) -> StatusBits:
+        """
+        Decoded status register flags from a single status read.
+
+        :return: A ``StatusBits`` namedtuple with ``heater``,
+            ``high_alert`` and ``low_alert`` booleans.
+        """
+        status = self._read_status()
+        return StatusBits(
+            heater=bool(status & _STATUS_HEATER),
+            high_alert=bool(status & _STATUS_HIGH_ALERT),
+            low_alert=bool(status & _STATUS_LOW_ALERT),
+        )
 
     @property
     def manufacturer_id(self) -> int:
@@ -126,7 +327,9 @@ class HDC302x:
 
         :return: The manufacturer ID.
         """
-        return self._read_command(0x3781)
+        if self._manufacturer_id is None:
+            self._manufacturer_id = self._read_command(_CMD_MANUFACTURER_ID)
+        return self._manufacturer_id
 
     @property
     def nist_id(self) -> List[int]:
@@ -135,31 +338,24 @@ class HDC302x:
 
         :return: NIST ID as a list of integers.
         """
-        id_part1 = self._read_command(0x3683)
-        id_part2 = self._read_command(0x3684)
-        id_part3 = self._read_command(0x3685)
-        return [
-            id_part1 >> 8,
-            id_part1 & 0xFF,
-            id_part2 >> 8,
-            id_part2 & 0xFF,
-            id_part3 >> 8,
-            id_part3 & 0xFF,
-        ]
+        if self._nist_id is None:
+            id_part1, id_part2, id_part3 = self._read_words(_CMD_NIST_ID, 3)
+            self._nist_id = (
+                id_part1 >> 8,
+                id_part1 & 0xFF,
+                id_part2 >> 8,
+                id_part2 & 0xFF,
+                id_part3 >> 8,
+                id_part3 & 0xFF,
+            )
+        return list(self._nist_id)
 
     @property
     def auto_mode(self) -> int:
         """
-        Auto mode for measurements.
-        Options:
-
-        "5MPS_LP0", "5MPS_LP1", "5MPS_LP2"
-        "5MPS_LP3", "1MPS_LP0", "1MPS_LP1"
-        "1MPS_LP2", "1MPS_LP3", "2MPS_LP0"
-        "2MPS_LP1", "2MPS_LP2", "2MPS_LP3"
-        "4MPS_LP0", "4MPS_LP1", "4MPS_LP2"
-        "4MPS_LP3", "10MPS_LP0", "10MPS_LP1"
-        "10MPS_LP2", "10MPS_LP3", "EXIT_AUTO_MODE"
+        Auto mode for measurements. Options are the module-level
+        ``AUTO_MODE_5MPS_LP0`` through ``AUTO_MODE_10MPS_LP3`` constants
+        and ``AUTO_MODE_EXIT``.
 
         :return: The current auto mode.
         """
@@ -170,11 +366,12 @@ class HDC302x:
         """
         :param mode: The auto mode to set.
         """
-        if mode not in self.AUTO_MODES:
+        if isinstance(mode, str):
+            mode = self.AUTO_MODES.get(mode)
+        if mode not in _VALID_AUTO_MODES:
             raise ValueError("Invalid auto mode value.")
-        _mode = self.AUTO_MODES[mode]
-        self._current_auto_mode = _mode
-        self._write_command(_mode)
+        self._current_auto_mode = mode
+        self._write_command(mode)
 
     @property
     def offsets(self) -> Tuple[float, float]:
@@ -183,12 +380,16 @@ class HDC302x:
 
         :return: The temperature and humidity offsets.
         """
-        combined_offsets = self._read_command(0xA004)
-        rh_offset = (combined_offsets >> 8) & 0xFF
-        temp_offset = combined_offsets & 0xFF
-        return self._invert_offset(temp_offset, True), self._invert_offset(
-            rh_offset, False
-        )
+        self._cmd2[0] = _CMD_OFFSETS >> 8
+        self._cmd2[1] = _CMD_OFFSETS & 0xFF
+        result = self._rx3
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._cmd2, result)
+        rh_offset = result[0]
+        temp_offset = result[1]
+        if self._verify_crc and _crc8_word((rh_offset << 8) | temp_offset) != result[2]:
+            raise RuntimeError("CRC check failed")
+        return _T_OFFSET_TABLE[temp_offset], _RH_OFFSET_TABLE[rh_offset]
 
     @offsets.setter
     def offsets(self, temp: float, humid: float) -> None:
@@ -198,7 +399,27 @@ class HDC302x:
         rh_offset = self._calculate_offset(humid, False)
         temp_offset = self._calculate_offset(temp, True)
         combined_offsets = (rh_offset << 8) | temp_offset
-        self._write_command_data(0xA004, combined_offsets)
+        self._write_command_data(_CMD_OFFSETS, combined_offsets)
+
+    @property
+    def measurements(self) -> Tuple[float, float]:
+        """
+        Temperature and relative humidity from a single measurement.
+
+        :return: The temperature in degrees Celsius and the relative
+            humidity in percent.
+        """
+        return self._measure_trh(_CMD_SINGLE_SHOT)
+
+    @property
+    def auto_measurements(self) -> Tuple[float, float]:
+        """
+        Temperature and relative humidity from a single auto mode read.
+
+        :return: The temperature in degrees Celsius and the relative
+            humidity in percent.
+        """
+        return self._measure_trh(_CMD_AUTO_READ)
 
     @property
     def auto_temperature(self) -> float:
@@ -207,7 +428,7 @@ class HDC302x:
 
         :return: The temperature in degrees Celsius.
         """
-        temp, _ = self._send_command_read_trh(0xE000)
+        temp, _ = self._measure_trh(_CMD_AUTO_READ)
         return temp
 
     @property
@@ -217,7 +438,7 @@ class HDC302x:
 
         :return: The relative humidity in percent.
         """
-        _, humid = self._send_command_read_trh(0xE000)
+        _, humid = self._measure_trh(_CMD_AUTO_READ)
         return humid
 
     @property
@@ -227,7 +448,7 @@ class HDC302x:
 
         :return: The temperature in degrees Celsius.
         """
-        temp, _ = self._send_command_read_trh(0x2400)
+        temp, _ = self._measure_trh(_CMD_SINGLE_SHOT)
         return temp
 
     @property
@@ -237,9 +458,32 @@ class HDC302x:
 
         :return: The relative humidity in percent.
         """
-        _, humid = self._send_command_read_trh(0x2400)
+        _, humid = self._measure_trh(_CMD_SINGLE_SHOT)
         return humid
 
+    def measurements_stream(self, count: int) -> Iterator[Tuple[float, float]]:
+        """
+        Yield ``count`` (temperature, relative humidity) pairs from auto mode.
+
+        The auto mode readout command is sent once, then the sample frames
+        are read back to back, amortizing the command write across the whole
+        run. ``auto_mode`` must be set to one of the measurement rates before
+        calling.
+
+        :param count: The number of measurements to yield.
+        """
+        self._write_command(_CMD_AUTO_READ)
+        buf = bytearray(6)
+        for _ in range(count):
+            with self.i2c_device as i2c:
+                i2c.readinto(buf)
+            temp_raw, temp_crc, hum_raw, hum_crc = _TRH_STRUCT.unpack_from(buf)
+            if self._verify_crc and (
+                _crc8_word(temp_raw) != temp_crc or _crc8_word(hum_raw) != hum_crc
+            ):
+                raise RuntimeError("CRC check failed")
+            yield (temp_raw * _T_SCALE + _T_OFFSET, hum_raw * _RH_SCALE)
+
     @property
     def high_alert(self) -> bool:
         """
@@ -247,8 +491,7 @@ class HDC302x:
 
         :return: True if the high alert is activated, False otherwise.
         """
-        status = self._read_command(0xF32D)
-        return bool(status & ((1 << 10) | (1 << 9)))
+        return bool(self._read_status() & _STATUS_HIGH_ALERT)
 
     @property
     def low_alert(self) -> bool:
@@ -257,8 +500,7 @@ class HDC302x:
 
         :return: True if the low alert is activated, False otherwise.
         """
-        status = self._read_command(0xF32D)
-        return bool(status & ((1 << 12) | (1 << 11)))
+        return bool(self._read_status() & _STATUS_LOW_ALERT)
 
     def set_high_alert(self, temp: float, humid: float) -> bool:
         """
@@ -267,7 +509,7 @@ class HDC302x:
         :param temp: The temperature threshold in degrees Celsius.
         :param humid: The relative humidity threshold in percent.
         """
-        self._alert_command(0x611D, temp, humid)
+        self._alert_command(_CMD_SET_HIGH_ALERT, temp, humid)
 
     def set_low_alert(self, temp: float, humid: float) -> bool:
         """
@@ -276,7 +518,7 @@ class HDC302x:
         :param temp: The temperature threshold in degrees Celsius.
         :param humid: The relative humidity threshold in percent.
         """
-        self._alert_command(0x6100, temp, humid)
+        self._alert_command(_CMD_SET_LOW_ALERT, temp, humid)
 
     def clear_high_alert(self, temp: float, humid: float) -> bool:
         """
@@ -285,7 +527,7 @@ class HDC302x:
         :param temp: The temperature threshold in degrees Celsius.
         :param humid: The relative humidity threshold in percent.
         """
-        self._alert_command(0x6116, temp, humid)
+        self._alert_command(_CMD_CLEAR_HIGH_ALERT, temp, humid)
 
     def clear_low_alert(self, temp: float, humid: float) -> bool:
         """
@@ -294,76 +536,112 @@ class HDC302x:
         :param temp: The temperature threshold in degrees Celsius.
         :param humid: The relative humidity threshold in percent.
         """
-        self._alert_command(0x610B, temp, humid)
+        self._alert_command(_CMD_CLEAR_LOW_ALERT, temp, humid)
 
     def _write_command(self, command: int) -> bool:
+        self._cmd2[0] = command >> 8
+        self._cmd2[1] = command & 0xFF
         with self.i2c_device as i2c:
-            i2c.write(bytes([command >> 8, command & 0xFF]))
+            i2c.write(self._cmd2)
 
     def _write_command_data(self, command: int, data: int) -> bool:
-        crc = self._calculate_crc8(struct.pack(">H", data))
+        buf = self._cmd5
+        buf[0] = command >> 8
+        buf[1] = command & 0xFF
+        buf[2] = (data >> 8) & 0xFF
+        buf[3] = data & 0xFF
+        buf[4] = _crc8_word(data)
         with self.i2c_device as i2c:
-            i2c.write(
-                bytes([command >> 8, command & 0xFF, data >> 8, data & 0xFF, crc])
-            )
+            i2c.write(buf)
 
     def _read_command(self, command: int) -> int:
+        self._cmd2[0] = command >> 8
+        self._cmd2[1] = command & 0xFF
+        result = self._rx3
         with self.i2c_device as i2c:
-            i2c.write_then_readinto(
-                bytes([command >> 8, command & 0xFF]), result := bytearray(3)
-            )
-        crc = self._calculate_crc8(result[:2])
-        if crc != result[2]:
+            i2c.write_then_readinto(self._cmd2, result)
+        word = (result[0] << 8) | result[1]
+        if self._verify_crc and _crc8_word(word) != result[2]:
             raise RuntimeError("CRC check failed")
-        return (result[0] << 8) | result[1]
-
-    def _send_command_read_trh(self, command: int) -> Tuple[float, float]:
-        self._write_command(command)
+        return word
+
+    def _read_words(self, command: int, count: int) -> List[int]:
+        # The sensor streams consecutive words (each followed by its CRC)
+        # within one read, so fetching them together costs a single bus
+        # transaction instead of one per word.
+        self._cmd2[0] = command >> 8
+        self._cmd2[1] = command & 0xFF
+        result = bytearray(3 * count)
         with self.i2c_device as i2c:
-            i2c.readinto(result := bytearray(6))
+            i2c.write_then_readinto(self._cmd2, result)
+        words = []
+        for i in range(0, 3 * count, 3):
+            word = (result[i] << 8) | result[i + 1]
+            if self._verify_crc and _crc8_word(word) != result[i + 2]:
+                raise RuntimeError("CRC check failed")
+            words.append(word)
+        return words
+
+    def _read_status(self, max_age: int = _STATUS_CACHE_TIMEOUT_NS) -> int:
+        now = time.monotonic_ns()
+        if now - self._status_time >= max_age:
+            self._status_val = self._read_command(_CMD_STATUS)
+            self._status_time = now
+        return self._status_val
+
+    def _measure_trh(self, command: int) -> Tuple[float, float]:
         if (
-            self._calculate_crc8(result[:2]) != result[2]
-            or self._calculate_crc8(result[3:5]) != result[5]
+            self._last_trh_cmd == command
+            and time.monotonic_ns() - self._last_trh_time < _TRH_CACHE_TIMEOUT_NS
+        ):
+            return self._last_trh
+        return self._send_command_read_trh(command)
+
+    def _send_command_read_trh(self, command: int) -> Tuple[float, float]:
+        result = self._rx6
+        if command == _CMD_AUTO_READ:
+            # Auto mode data is already converted, so the result can be
+            # fetched in one transaction with a repeated START.
+            self._cmd2[0] = command >> 8
+            self._cmd2[1] = command & 0xFF
+            with self.i2c_device as i2c:
+                i2c.write_then_readinto(self._cmd2, result)
+        else:
+            # Single-shot commands trigger a conversion, so the read stays
+            # a separate transaction issued after the trigger completes.
+            self._write_command(command)
+            with self.i2c_device as i2c:
+                i2c.readinto(result)
+        temp_raw, temp_crc, hum_raw, hum_crc = _TRH_STRUCT.unpack_from(result)
+        if self._verify_crc and (
+            _crc8_word(temp_raw) != temp_crc or _crc8_word(hum_raw) != hum_crc
         ):
             raise RuntimeError("CRC check failed")
-        temp_raw = (result[0] << 8) | result[1]
-        hum_raw = (result[3] << 8) | result[4]
-        temperature = ((temp_raw / 65535.0) * 175.0) - 45.0
-        relative_humidity = (hum_raw / 65535.0) * 100.0
-        return temperature, relative_humidity
+        temperature = temp_raw * _T_SCALE + _T_OFFSET
+        relative_humidity = hum_raw * _RH_SCALE
+        self._last_trh = (temperature, relative_humidity)
+        self._last_trh_cmd = command
+        self._last_trh_time = time.monotonic_ns()
+        return self._last_trh
 
     def _alert_command(self, command: int, temp: float, humid: float) -> bool:
-        raw_temp = int(((temp + 45.0) / 175.0) * 65535.0)
-        raw_rh = int((humid / 100.0) * 65535.0)
-        msb_rh = (raw_rh >> 9) & 0x7F
-        msb_temp = (raw_temp >> 7) & 0x1FF
-        threshold = (msb_rh << 9) | msb_temp
+        raw_temp = int((temp + 45.0) * _ALERT_T_SCALE)
+        raw_rh = int(humid * _ALERT_RH_SCALE)
+        threshold = ((raw_rh >> 9) & 0x7F) << 9 | ((raw_temp >> 7) & 0x1FF)
         self._write_command_data(command, threshold)
 
-    @staticmethod
-    def _calculate_crc8(data: bytes) -> int:
-        """Calculate the CRC-8 checksum."""
-        crc = 0xFF
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                crc = (crc << 1) ^ 0x31 if crc & 0x80 else crc << 1
-        return crc & 0xFF
+    _calculate_crc8 = staticmethod(_crc8)
 
     @staticmethod
     def _calculate_offset(value: float, is_temp: bool) -> int:
         """Calculate the closest matching offset byte for temperature or relative humidity."""
-        lsb = 0.1708984375 if is_temp else 0.1953125
+        lsb_inv = _T_MILLI_LSB_INV_Q20 if is_temp else _RH_MILLI_LSB_INV_Q20
         sign = 0x00 if value < 0 else 0x80
-        abs_value = abs(value)
-        offset = int(round(abs_value / lsb))
+        abs_milli = int(abs(value) * 1000.0 + 0.5)
+        offset = (abs_milli * lsb_inv + (1 << 19)) >> 20
         return sign | offset
 
     @staticmethod
     def _invert_offset(offset: int, is_temp: bool) -> float:
-        """Invert the offset byte to a floating point value."""
-        lsb = 0.1708984375 if is_temp else 0.1953125
-        is_negative = not offset & 0x80
-        abs_offset = offset & 0x7F
-        value = abs_offset * lsb
-        return -value if is_negative else value
+        """Look up the floating point value for an offset byte."""
+        return (_T_OFFSET_TABLE if is_temp else _RH_OFFSET_TABLE)[offset]